@@ -24,6 +24,7 @@
 #include "../apps/mini_placement/placement_interface.h"
 #include "../apps/mini_placement/placer_engine.h"
 #include "../lib/include/placer_db.h"
+#include "../lib/include/placement_plotter.h"
 
 // Routing modules
 #include "../apps/mini_router/routing_interface.h"
@@ -317,6 +318,9 @@ int main(int argc, char* argv[]) {
         // ========================================================================
         runPostRoutingSTA(config, netlist_db);
         
+        // Wait for placement frames still rendering in the background
+        PlacementPlotter::finish();
+        
         // ========================================================================
         // 7. Report completion
         // ========================================================================
@@ -12,6 +12,7 @@
 #include <chrono>
 #include "../../lib/include/hpwl_calculator.h"
 #include "../../lib/include/csv_exporter.h"
+#include "../../lib/include/placement_plotter.h"
 
 namespace mini {
 
@@ -381,6 +382,7 @@ void GlobalPlacer::runPlacement() {
     
     // Final export
     exportPlacementImage(max_iterations_);
+    PlacementPlotter::flush();
     printFinalStatistics();
     
     // Export density visualization
@@ -775,24 +777,12 @@ void GlobalPlacer::exportPlacementImage(int iteration) const {
     std::string csv_filename = "placement_iter_" + std::to_string(iteration) + ".csv";
     exportPlacement(csv_filename);
     
-    // Generate PNG image using Python script
-    std::string run_dir = "visualizations/" + run_id_;
-    std::string csv_path = run_dir + "/" + csv_filename;
+    // Queue the frame; the whole iteration series is rendered in one batch
     std::string png_filename = "electro_iter_" + std::to_string(iteration) + ".png";
-    std::string png_path = run_dir + "/" + png_filename;
-    
-    // Call Python script to generate visualization
-    std::string plot_cmd = "cd visualizations && python3 plot_placement.py " + 
-                          run_id_ + "/" + csv_filename + " " + 
-                          run_id_ + "/" + png_filename +
-                          " --title \"Global Placement - Iteration " + std::to_string(iteration) + "\"";
-    
-    int result = std::system(plot_cmd.c_str());
-    if (result == 0) {
-        std::cout << "  Global placement iteration " << iteration << " PNG exported" << std::endl;
-    } else {
-        std::cout << "  Global placement iteration " << iteration << " CSV exported (visualization failed)" << std::endl;
-    }
+    PlacementPlotter::enqueue(run_id_ + "/" + csv_filename,
+                              run_id_ + "/" + png_filename,
+                              "Global Placement - Iteration " + std::to_string(iteration));
+    std::cout << "  Global placement iteration " << iteration << " CSV exported (PNG queued)" << std::endl;
 }
 
 void GlobalPlacer::exportPlacement(const std::string& filename) const {
@@ -8,6 +8,7 @@
 #include "placer_engine.h"
 #include "macro_mapper.h"
 #include "../../lib/include/csv_exporter.h"
+#include "../../lib/include/placement_plotter.h"
 #include "../../lib/include/lef_parser.h"
 #include "../../lib/include/liberty_parser.h"
 
@@ -222,12 +223,10 @@ std::unique_ptr<PlacerDB> PlacementInterface::runPlacementWithVisualization(
     
     // Export CSV using CSVExporter
     if (CSVExporter::exportPlacement(placer_db.get(), csv_path)) {
-        // Generate visualization using Python script
-        std::string plot_cmd = "cd visualizations && python3 plot_placement.py " + 
-                              config.run_id + "/00_random.csv " +
-                              config.run_id + "/00_random.png " +
-                              "--title \"Random Placement\"";
-        std::system(plot_cmd.c_str());
+        // Queue visualization; rendered together with the global placement frames
+        PlacementPlotter::enqueue(config.run_id + "/00_random.csv",
+                                  config.run_id + "/00_random.png",
+                                  "Random Placement");
     }
     
     if (config.verbose) {
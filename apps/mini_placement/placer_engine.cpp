@@ -11,6 +11,7 @@
 #include "overlap_detector.h"
 #include "../../lib/include/hpwl_calculator.h"
 #include "../../lib/include/csv_exporter.h"
+#include "../../lib/include/placement_plotter.h"
 #include <iostream>
 #include <algorithm>
 #include <memory>
@@ -62,6 +63,8 @@ void PlacerEngine::runGlobalPlacementWithAlgorithm(const std::string& algorithm)
     auto end_time = std::chrono::high_resolution_clock::now();
     auto duration = std::chrono::duration_cast<std::chrono::milliseconds>(end_time - start_time);
     
+    PlacementPlotter::flush();
+    
     std::cout << "Global Placement completed in " << duration.count() << " ms" << std::endl;
     std::cout << "Final HPWL: " << current_hpwl_ << std::endl;
 }
@@ -105,6 +108,8 @@ void PlacerEngine::runGlobalPlacement() {
         current_hpwl_ = new_hpwl;
     }
     
+    PlacementPlotter::flush();
+    
     std::cout << "Global Placement completed. Final HPWL: " << current_hpwl_ << std::endl;
     std::cout << "Improvement: " << (netlist_db ? HPWLCalculator::calculateHPWL(netlist_db, db_) : 0.0 - current_hpwl_) << std::endl;
 }
@@ -148,6 +153,7 @@ void PlacerEngine::runLegalization() {
     
     // Visualize the result
     exportAndVisualize("legalized");
+    PlacementPlotter::flush();
     
     std::cout << "Legalization completed!" << std::endl;
 }
@@ -176,6 +182,7 @@ void PlacerEngine::runDetailedPlacement() {
     
     // Visualize final result
     exportAndVisualize("detailed");
+    PlacementPlotter::flush();
 }
 
 void PlacerEngine::solveForceDirectedIteration(int iter) {
@@ -444,12 +451,10 @@ void PlacerEngine::exportAndVisualize(const std::string& filename) const {
     // Export CSV using CSVExporter
     std::string csv_path = "visualizations/" + run_id_ + "/" + filename + ".csv";
     if (CSVExporter::exportPlacement(db_, csv_path)) {
-        // Generate visualization using Python script
-        std::string plot_cmd = "cd visualizations && python3 plot_placement.py " + 
-                              run_id_ + "/" + filename + ".csv " +
-                              run_id_ + "/" + filename + ".png " +
-                              "--title \"Placement - " + filename + "\"";
-        std::system(plot_cmd.c_str());
+        // Queue the frame; it is rendered when the current stage flushes
+        PlacementPlotter::enqueue(run_id_ + "/" + filename + ".csv",
+                                  run_id_ + "/" + filename + ".png",
+                                  "Placement - " + filename);
     }
 }
 
@@ -170,7 +170,7 @@ private:
     double calculateTotalOverlap() const;
 
     /**
-     * @brief Export placement to CSV and generate visualization using Python script
+     * @brief Export placement to CSV and queue it for batched visualization
      * @param filename Base filename (without extension)
      */
     void exportAndVisualize(const std::string& filename) const;
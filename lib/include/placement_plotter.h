@@ -0,0 +1,64 @@
+/**
+ * @file placement_plotter.h
+ * @brief Batched Placement Visualization for MiniEDA
+ * @details Collects placement snapshots and streams them to one long-lived
+ *          plot_placement.py --serve process instead of starting Python per frame
+ */
+
+#ifndef MINI_PLACEMENT_PLOTTER_H
+#define MINI_PLACEMENT_PLOTTER_H
+
+#include <cstdio>
+#include <string>
+#include <vector>
+
+namespace mini {
+
+/**
+ * @class PlacementPlotter
+ * @brief Static queue of placement frames waiting to be rendered
+ * @details All paths are relative to the visualizations/ directory, matching
+ *          the arguments plot_placement.py expects
+ */
+class PlacementPlotter {
+public:
+    /**
+     * @brief Queue a placement CSV for rendering
+     * @param csv_path Input CSV path (relative to visualizations/)
+     * @param png_path Output PNG path (relative to visualizations/)
+     * @param title Plot title
+     */
+    static void enqueue(const std::string& csv_path, const std::string& png_path,
+                        const std::string& title);
+
+    /**
+     * @brief Hand every queued frame to the renderer as one batch
+     * @return True if the batch was handed over (or nothing was queued)
+     * @details Starts plot_placement.py --serve on first use and writes the
+     *          jobs to its stdin; frames render while the caller continues.
+     *          SIGPIPE is ignored (process-wide) while the batch is written,
+     *          and the previous handler is restored afterwards
+     */
+    static bool flush();
+
+    /**
+     * @brief Flush pending frames and wait for the renderer to exit
+     * @return True if every frame was rendered (or the renderer never started)
+     * @details Also run automatically at program exit
+     */
+    static bool finish();
+
+private:
+    struct PlotJob {
+        std::string csv_path;
+        std::string png_path;
+        std::string title;
+    };
+
+    static std::vector<PlotJob>& pendingJobs();
+    static FILE*& server();
+};
+
+} // namespace mini
+
+#endif // MINI_PLACEMENT_PLOTTER_H
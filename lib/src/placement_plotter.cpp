@@ -0,0 +1,88 @@
+/**
+ * @file placement_plotter.cpp
+ * @brief Batched Placement Visualization Implementation
+ */
+
+#include "placement_plotter.h"
+#include <csignal>
+#include <cstdio>
+#include <iostream>
+
+namespace mini {
+
+std::vector<PlacementPlotter::PlotJob>& PlacementPlotter::pendingJobs() {
+    static std::vector<PlotJob> jobs;
+    return jobs;
+}
+
+void PlacementPlotter::enqueue(const std::string& csv_path, const std::string& png_path,
+                               const std::string& title) {
+    pendingJobs().push_back({csv_path, png_path, title});
+}
+
+FILE*& PlacementPlotter::server() {
+    static FILE* pipe = nullptr;
+    // Created after the job queue, so it is destroyed (and waits for the
+    // renderer) while the queue is still alive
+    static struct ExitGuard {
+        ~ExitGuard() { PlacementPlotter::finish(); }
+    } exit_guard;
+    return pipe;
+}
+
+bool PlacementPlotter::flush() {
+    std::vector<PlotJob>& jobs = pendingJobs();
+    if (jobs.empty()) {
+        return true;
+    }
+
+    FILE*& pipe = server();
+    if (pipe == nullptr) {
+        pipe = popen("cd visualizations && exec python3 plot_placement.py --serve", "w");
+        if (pipe == nullptr) {
+            std::cerr << "Warning: Cannot start placement renderer" << std::endl;
+            jobs.clear();
+            return false;
+        }
+    }
+
+    // One job per line; a blank line ends the batch
+    std::string batch;
+    for (const auto& job : jobs) {
+        batch += job.csv_path + "\t" + job.png_path + "\t" + job.title + "\n";
+    }
+    batch += "\n";
+
+    // A renderer that failed to start or exited must fail the write instead
+    // of killing us with SIGPIPE; the caller's handler is restored afterwards
+    void (*previous_handler)(int) = std::signal(SIGPIPE, SIG_IGN);
+    bool sent = std::fwrite(batch.data(), 1, batch.size(), pipe) == batch.size() &&
+                std::fflush(pipe) == 0;
+    std::signal(SIGPIPE, previous_handler);
+    if (!sent) {
+        std::cerr << "Warning: Failed to send " << jobs.size()
+                  << " placement frame(s) to the renderer" << std::endl;
+    }
+
+    jobs.clear();
+    return sent;
+}
+
+bool PlacementPlotter::finish() {
+    flush();
+
+    FILE*& pipe = server();
+    if (pipe == nullptr) {
+        return true;
+    }
+
+    int result = pclose(pipe);
+    pipe = nullptr;
+    if (result != 0) {
+        std::cerr << "Warning: Some placement frames failed to render "
+                  << "(see the renderer output above)" << std::endl;
+    }
+    return result == 0;
+}
+
+} // namespace mini
@@ -0,0 +1,295 @@
+#!/usr/bin/env python3
+"""
+Test program for the placement plotter (visualizations/plot_placement.py)
+Usage: python3 test/test_plot_placement.py
+"""
+
+import os
+import contextlib
+import io
+import re
+import subprocess
+import sys
+import tempfile
+import xml.etree.ElementTree as ET
+
+import numpy as np
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                                '..', 'visualizations'))
+import plot_placement
+
+SCRIPT = os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                      '..', 'visualizations', 'plot_placement.py')
+
+SVG_NS = '{http://www.w3.org/2000/svg}'
+XLINK_HREF = '{http://www.w3.org/1999/xlink}href'
+
+def write_frame(path, num_cells, width, height):
+    """Write a placement CSV of equal-size cells spread over a 100 um core"""
+    with open(path, 'w') as f:
+        f.write('cell_name,x,y,width,height,fixed\n')
+        for i in range(num_cells):
+            f.write(f'CELL_{i},{(i * 7) % 97},{(i * 13) % 89},{width},{height},false\n')
+
+def run_quiet(fn, *args, **kwargs):
+    """Call fn and return what it printed"""
+    out = io.StringIO()
+    with contextlib.redirect_stdout(out):
+        fn(*args, **kwargs)
+    return out.getvalue()
+
+def group(root, group_id):
+    """The <g> element with the given id"""
+    return next(g for g in root.iter(SVG_NS + 'g') if g.get('id') == group_id)
+
+def path_width(d):
+    """Horizontal extent of an SVG path's 'M x y L x y ...' data"""
+    xs = [float(x) for x in re.findall(r'([-\d.]+) [-\d.]+', d)]
+    return max(xs) - min(xs)
+
+def test_svg_cell_scale():
+    """Size-class cells in an .svg frame use the same scale as the ticks"""
+    print("Testing .svg cell scale against tick spacing...")
+
+    cell_width = 3.6
+    with tempfile.TemporaryDirectory() as tmp:
+        csv_file = os.path.join(tmp, 'frame.csv')
+        svg_file = os.path.join(tmp, 'frame.svg')
+        write_frame(csv_file, 300, cell_width, 1.4)
+
+        cells = plot_placement.load_cells(csv_file)
+        fig, ax = plot_placement.new_figure()
+        plot_placement.render_placement(fig, ax, cells, svg_file, 'SVG scale', labels=False)
+        ticks = [x for x in ax.get_xticks() if ax.get_xlim()[0] <= x <= ax.get_xlim()[1]]
+        root = ET.parse(svg_file).getroot()
+
+    # Tick marks are <use> elements placed at each tick's x (points)
+    tick_x = [float(next(group(root, f'xtick_{i + 1}').iter(SVG_NS + 'use')).get('x'))
+              for i in range(len(ticks))]
+    tick_scale = (tick_x[-1] - tick_x[0]) / (ticks[-1] - ticks[0])
+
+    # Every cell shares one template path in the first size-class collection
+    template = next(group(root, 'PathCollection_1').iter(SVG_NS + 'path'))
+    cell_scale = path_width(template.get('d')) / cell_width
+
+    print(f"  Ticks: {tick_scale:.3f} pt/um, cells: {cell_scale:.3f} pt/um")
+    if abs(cell_scale - tick_scale) > 0.01 * tick_scale:
+        print("  FAILED: cell template is not drawn at the axes scale")
+        return False
+    print("  PASSED")
+    return True
+
+def test_svg_keeps_stacked_cells():
+    """Vector frames keep cells that share a pixel with another cell"""
+    print("Testing .svg frames keep stacked cells...")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        csv_file = os.path.join(tmp, 'frame.csv')
+        svg_file = os.path.join(tmp, 'frame.svg')
+        with open(csv_file, 'w') as f:
+            f.write('cell_name,x,y,width,height,fixed\n')
+            f.write('A,10,10,2,1,false\nB,10.004,10,2,1,false\n')
+            f.write('C,20,15,2,1,false\nD,30,25,2,1,false\n')
+        cells = plot_placement.load_cells(csv_file)
+        fig, ax = plot_placement.new_figure()
+        plot_placement.render_placement(fig, ax, cells, svg_file, 'Stacked', labels=False)
+        root = ET.parse(svg_file).getroot()
+
+    stamps = list(group(root, 'PathCollection_1').iter(SVG_NS + 'use'))
+    print(f"  Cell stamps: {len(stamps)}")
+    if len(stamps) != 4:
+        print("  FAILED: expected one stamp per cell")
+        return False
+    print("  PASSED")
+    return True
+
+def test_csv_malformed_rows():
+    """Short rows are skipped and a '#' in a cell name is kept"""
+    print("Testing CSV reading with malformed rows...")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        csv_file = os.path.join(tmp, 'frame.csv')
+        with open(csv_file, 'w') as f:
+            f.write('cell_name,x,y,width,height,fixed\n')
+            f.write('U#1,1,2,3,4,false\n')
+            f.write('TRUNCATED,5,6\n')
+            f.write('\n')
+            f.write('U2,7,8,1,1,true\n')
+        data = plot_placement.read_placement_csv(csv_file)
+
+    if data is None or list(data['cell_name']) != ['U#1', 'U2']:
+        print(f"  FAILED: expected cells ['U#1', 'U2'], got "
+              f"{None if data is None else list(data['cell_name'])}")
+        return False
+    if list(data['x']) != [1.0, 7.0] or list(data['fixed']) != [False, True]:
+        print("  FAILED: cell fields were not parsed")
+        return False
+
+    # A non-numeric coordinate is a read error, not a crash
+    with tempfile.TemporaryDirectory() as tmp:
+        csv_file = os.path.join(tmp, 'frame.csv')
+        with open(csv_file, 'w') as f:
+            f.write('cell_name,x,y,width,height,fixed\n')
+            f.write('U1,abc,1,1,1,false\n')
+        data = plot_placement.read_placement_csv(csv_file)
+    if data is not None:
+        print("  FAILED: a non-numeric field was not reported as a read error")
+        return False
+    print("  PASSED")
+    return True
+
+def test_frame_key_cache():
+    """An unchanged frame is skipped; any change to its inputs redraws it"""
+    print("Testing the frame-key cache...")
+
+    options = plot_placement.RENDER_DEFAULTS
+    with tempfile.TemporaryDirectory() as tmp:
+        csv_file = os.path.join(tmp, 'frame.csv')
+        moved_file = os.path.join(tmp, 'moved.csv')
+        png_file = os.path.join(tmp, 'frame.png')
+        write_frame(csv_file, 50, 2.0, 1.0)
+        with open(csv_file) as f, open(moved_file, 'w') as g:
+            lines = f.readlines()
+            lines[1] = lines[1].replace('CELL_0,0,', 'CELL_0,1,')
+            g.writelines(lines)
+
+        def render(csv=csv_file, title='Frame', **changes):
+            return run_quiet(plot_placement.plot_placement, csv, png_file, title,
+                             dict(options, **changes))
+
+        # Each change is made against a freshly drawn base frame
+        cases = []
+        for change, kwargs, redrawn in [('same inputs', {}, False),
+                                        ('title', {'title': 'Other'}, True),
+                                        ('view', {'view': (0, 0, 50, 50)}, True),
+                                        ('labels', {'labels': False}, True),
+                                        ('coordinate', {'csv': moved_file}, True),
+                                        ('--force', {'force': True}, True)]:
+            render()
+            cases.append((change, render(**kwargs), redrawn))
+
+    for change, output, redrawn in cases:
+        if ('Visualization saved as' in output) != redrawn:
+            print(f"  FAILED: {change}: expected {'a redraw' if redrawn else 'unchanged'}, "
+                  f"got: {output.splitlines()[0] if output else 'no output'}")
+            return False
+    print("  PASSED")
+    return True
+
+def test_label_merging():
+    """Labels sharing a screen slot merge; too narrow cells get no label"""
+    print("Testing cell label merging...")
+
+    names = ['U1', 'U2', 'U3', 'U4']
+    # U1 and U2 share a slot, U3 is too narrow to label, U4 is on its own
+    px = np.array([5.0, 25.0, 100.0, 200.0])
+    py = np.array([5.0, 6.0, 50.0, 50.0])
+    pw = np.array([10.0, 10.0, 3.0, 10.0])
+    indices, counts = plot_placement.label_slots(px, py, pw)
+    labels = [plot_placement.label_text(names[i], count) for i, count in zip(indices, counts)]
+
+    print(f"  Labels: {labels}")
+    if labels != ['U1 +1', 'U4']:
+        print("  FAILED: expected ['U1 +1', 'U4']")
+        return False
+    print("  PASSED")
+    return True
+
+def test_collapsed_frames():
+    """A cluster collapses to one box only where it is tiny on screen"""
+    print("Testing collapsed frames...")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        csv_file = os.path.join(tmp, 'frame.csv')
+        png_file = os.path.join(tmp, 'frame.png')
+        # 30 cells whose centers lie within 0.1 um of each other
+        with open(csv_file, 'w') as f:
+            f.write('cell_name,x,y,width,height,fixed\n')
+            for i in range(30):
+                f.write(f'CELL_{i},{10 + 0.003 * i:.3f},{20 + 0.02 * (i % 5):.2f},0.5,0.3,false\n')
+        cells = plot_placement.load_cells(csv_file)
+        fig, ax = plot_placement.new_figure()
+        fitted = run_quiet(plot_placement.render_placement, fig, ax, cells, png_file, 'Fitted')
+        wide = run_quiet(plot_placement.render_placement, fig, ax, cells, png_file, 'Wide',
+                         view=(0, 0, 600, 600))
+
+    if 'Collapsed frame' in fitted:
+        print("  FAILED: a cluster filling the fitted view was collapsed")
+        return False
+    if 'Collapsed frame' not in wide:
+        print("  FAILED: a cluster a few pixels across was not collapsed")
+        return False
+    print("  PASSED")
+    return True
+
+def write_bad_frame(path):
+    """Write a placement CSV with a non-numeric coordinate"""
+    with open(path, 'w') as f:
+        f.write('cell_name,x,y,width,height,fixed\nU1,abc,1,1,1,false\n')
+
+def test_batch():
+    """--batch renders every readable frame and fails only the bad one"""
+    print("Testing --batch...")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        jobs_file = os.path.join(tmp, 'jobs.txt')
+        frames = [os.path.join(tmp, f'frame_{i}') for i in range(3)]
+        for i, frame in enumerate(frames):
+            write_frame(frame + '.csv', 50 + 10 * i, 2.0, 1.0)
+        write_bad_frame(os.path.join(tmp, 'bad.csv'))
+        with open(jobs_file, 'w') as f:
+            f.write(f"{frames[0]}.csv\t{frames[0]}.png\tFirst\n")
+            f.write(f"{os.path.join(tmp, 'bad.csv')}\t{os.path.join(tmp, 'bad.png')}\n")
+            f.write(f"{frames[1]}.csv\n{frames[2]}.csv\n")
+        result = subprocess.run([sys.executable, SCRIPT, '--batch', jobs_file, '--workers', '2'],
+                                capture_output=True, text=True)
+        rendered = [os.path.exists(frame + '.png') for frame in frames]
+
+    if not all(rendered):
+        print(f"  FAILED: frames rendered: {rendered}")
+        return False
+    if result.returncode != 1 or 'Batch rendered 3/4 frames' not in result.stdout:
+        print(f"  FAILED: expected exit code 1 and 3/4 frames, got {result.returncode}")
+        return False
+    print("  PASSED")
+    return True
+
+def test_serve():
+    """--serve renders each stdin batch and survives a bad frame"""
+    print("Testing --serve...")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        frames = [os.path.join(tmp, f'frame_{i}') for i in range(2)]
+        for i, frame in enumerate(frames):
+            write_frame(frame + '.csv', 50 + 10 * i, 2.0, 1.0)
+        bad_file = os.path.join(tmp, 'bad.csv')
+        write_bad_frame(bad_file)
+        # A batch holding only the bad frame, then one batch per good frame
+        jobs = f"{bad_file}\n\n{frames[0]}.csv\n\n{frames[1]}.csv\n"
+        result = subprocess.run([sys.executable, SCRIPT, '--serve', '--workers', '1'],
+                                input=jobs, capture_output=True, text=True)
+        rendered = [os.path.exists(frame + '.png') for frame in frames]
+
+    if not all(rendered):
+        print(f"  FAILED: frames rendered after the bad one: {rendered}")
+        return False
+    if result.returncode != 1 or result.stdout.count('Batch rendered 1/1 frames') != 2:
+        print(f"  FAILED: expected exit code 1 and two full batches, got {result.returncode}")
+        return False
+    print("  PASSED")
+    return True
+
+def main():
+    print("=== Testing plot_placement.py ===")
+
+    results = [test_svg_cell_scale(), test_svg_keeps_stacked_cells(),
+               test_csv_malformed_rows(), test_frame_key_cache(),
+               test_label_merging(), test_collapsed_frames(),
+               test_batch(), test_serve()]
+
+    print(f"=== {sum(results)}/{len(results)} tests passed ===")
+    return 0 if all(results) else 1
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -2,165 +2,1148 @@
 """
 Plot placement visualization from CSV data
 Usage: python3 plot_placement.py <csv_file> [output_file] [--title "Custom Title"]
+       python3 plot_placement.py --batch <jobs_file> [--workers N]
+       python3 plot_placement.py --serve [--workers N]
+       Any mode accepts --engine pillow or svg for quick previews without
+       axes (svg writes .svg files), and --no-labels to skip cell name
+       labels.
+       --view X_MIN Y_MIN X_MAX Y_MAX fixes the plotted region (micrometers);
+       cells entirely outside it are not drawn.
+
+An output file ending in .svg gets a vector frame instead of a raster one.
+PNG frames carry a hash of their inputs; a frame whose output already holds
+the same hash is not drawn again (use --force to redraw anyway), and a run
+with nothing to redraw never imports matplotlib.
+
+Input may also be an .npz holding the CSV columns as arrays
+(cell_name, x, y, width, height, fixed).
+A jobs file holds one frame per line: <csv_file>\t<output_file>[\t<title>].
+With --serve, job lines are read from stdin and a blank line ends each batch,
+so one process (and one matplotlib import) serves a whole placement run.
+Batch frames are rendered by a process pool; each worker keeps one figure
+alive and clears it between frames. All frames of a batch share one view, so
+the static chrome (core outline, axes, ticks, grid) is rasterized once per
+worker and blitted under the cells of every later frame.
 """
 
 import sys
 import os
-import matplotlib.pyplot as plt
-import matplotlib.patches as patches
+import warnings
+import weakref
+import hashlib
+import contextlib
+import html
+from concurrent.futures import ThreadPoolExecutor
+import numpy as np
+from PIL import Image, ImageDraw, ImageFont
+from PIL.PngImagePlugin import PngInfo
 import argparse
+import multiprocessing
 
-def plot_placement(csv_file, output_file=None, title=None):
-    """Read placement data from CSV and create visualization"""
+# matplotlib is imported inside the functions that draw, never at module
+# load: a run whose frames are all up to date only hashes its inputs and
+# never pays for the import
+
+# Shared by every label so font properties are resolved only once
+_label_font = None
+
+def label_font():
+    """Font properties of the cell labels, created on first use"""
+    global _label_font
+    if _label_font is None:
+        from matplotlib.font_manager import FontProperties
+        _label_font = FontProperties(size=6)
+    return _label_font
+
+# Fixed figure geometry: margins are set once instead of measured per save
+FIGSIZE = (12, 10)
+DPI = 100
+MARGINS = dict(left=0.07, right=0.98, bottom=0.06, top=0.95)
+
+# Frames are flat fills plus antialiased edges and text: a 256-color palette
+# keeps them visually identical while halving PNG size and encode time
+PALETTE_COLORS = 256
+
+# zlib level for frames: level 3 deflates a palette frame about twice as fast
+# as the default 6 for 15-35% more bytes (level 1 is barely faster still)
+PNG_COMPRESS_LEVEL = 3
+
+# Frames whose cell centers all lie within this span on screen (pixels) are
+# drawn as one summary box: the individual rectangles would be
+# indistinguishable. Measured on screen, not in micrometers, so a tight or
+# zoomed view that spreads the same cells apart still draws them all.
+COLLAPSED_SPREAD = 3
+
+def new_figure():
+    """Create a placement figure with fixed margins
+    
+    Built on the OO API: the figure is not registered with pyplot, so it
+    needs no close() and is freed with its last reference.
+    """
+    from matplotlib.figure import Figure
+    from matplotlib.backends.backend_agg import FigureCanvasAgg
+    
+    fig = Figure(figsize=FIGSIZE, dpi=DPI)
+    FigureCanvasAgg(fig)
+    fig.subplots_adjust(**MARGINS)
+    return fig, fig.add_subplot()
+
+# Vertex buffer of the per-cell outline fallback, grown as needed and reused
+# by every later frame of the process
+_verts_buffer = np.empty((0, 4, 2))
+
+def cell_verts(x, y, width, height):
+    """Fill (N, 4, 2) rectangle vertices into the reused vertex buffer
+    
+    The result is only valid until the next call; set_verts() copies it.
+    """
+    global _verts_buffer
+    if len(_verts_buffer) < len(x):
+        _verts_buffer = np.empty((len(x), 4, 2))
+    verts = _verts_buffer[:len(x)]
+    verts[:, 0, 0] = verts[:, 3, 0] = x
+    verts[:, 0, 1] = verts[:, 1, 1] = y
+    np.add(x, width, out=verts[:, 1, 0])
+    verts[:, 2, 0] = verts[:, 1, 0]
+    np.add(y, height, out=verts[:, 2, 1])
+    verts[:, 3, 1] = verts[:, 2, 1]
+    return verts
+
+# Screen slot (pixels, x by y) holding at most one label; labels of cells that
+# land in the same slot would print on top of each other and stay unreadable
+LABEL_SLOT = (40, 10)
+
+# Cells narrower than this on screen (pixels) get no label of their own
+LABEL_MIN_WIDTH = 6
+
+def label_slots(px, py, pw):
+    """Labels to draw: the first labeled cell in each screen slot
+    
+    Returns the cell indices and how many labeled cells share each slot.
+    """
+    labeled = np.flatnonzero(pw >= LABEL_MIN_WIDTH)
+    slots = np.column_stack([np.floor_divide(px[labeled], LABEL_SLOT[0]),
+                             np.floor_divide(py[labeled], LABEL_SLOT[1])])
+    _, first, counts = np.unique(slots, axis=0, return_index=True, return_counts=True)
+    order = np.argsort(first)
+    return labeled[first[order]], counts[order]
+
+def label_text(name, count):
+    """Label of a slot: the cell name, plus how many labels it stands for"""
+    return name if count == 1 else f'{name} +{count - 1}'
+
+def cell_labels(ax, cells):
+    """Readable cell name labels, anchored at the cell centers
+    
+    Returns the label texts with their data and pixel anchors. Cells too
+    narrow on screen are not labeled, and cells whose labels would overlap
+    share one label.
+    """
+    centers = np.column_stack([cells['x'] + cells['width'] / 2,
+                               cells['y'] + cells['height'] / 2])
+    pixels = ax.transData.transform(centers)
+    widths = cells['width'] * ax.transData.get_matrix()[0, 0]
+    
+    indices, counts = label_slots(pixels[:, 0], pixels[:, 1], widths)
+    texts = [label_text(cells['cell_name'][i], count) for i, count in zip(indices, counts)]
+    return texts, centers[indices], pixels[indices]
+
+def draw_cell_labels(ax, texts, centers):
+    """Add the labels to the axes as text artists and return them"""
+    return [ax.text(x, y, text, ha='center', va='center', fontproperties=label_font(),
+                    alpha=0.7, clip_on=True, parse_math=False)
+            for text, (x, y) in zip(texts, centers)]
+
+# Scratch canvas (pixels, x by y) that label sprites are rendered on; wider
+# than any label, which is anchored at its center
+SPRITE_CANVAS = (1000, 40)
+
+# Label sprites keyed by text: every distinct label is rendered by matplotlib
+# once per process and then stamped into each frame that shows it
+_label_sprites = {}
+_sprite_text = None
+
+def label_sprite(text):
+    """Ink coverage of a label, scaled by the label alpha, and the (row,
+    column) offset of its top-left pixel from the label anchor"""
+    global _sprite_text
+    sprite = _label_sprites.get(text)
+    if sprite is not None:
+        return sprite
     
-    cells = []
+    if _sprite_text is None:
+        from matplotlib.figure import Figure
+        from matplotlib.backends.backend_agg import FigureCanvasAgg
+        fig = Figure(figsize=(SPRITE_CANVAS[0] / DPI, SPRITE_CANVAS[1] / DPI), dpi=DPI)
+        FigureCanvasAgg(fig)
+        _sprite_text = fig.text(0.5, 0.5, '', ha='center', va='center',
+                                fontproperties=label_font(), parse_math=False)
+    _sprite_text.set_text(text)
+    canvas = _sprite_text.figure.canvas
+    canvas.draw()
+    
+    # Black on white: coverage is what the glyphs took off the red channel
+    coverage = 1 - np.asarray(canvas.buffer_rgba())[:, :, 0] / 255
+    rows, cols = np.nonzero(coverage)
+    if len(rows) == 0:
+        sprite = (np.zeros((0, 0)), 0, 0)
+    else:
+        top, left = rows.min(), cols.min()
+        sprite = (0.7 * coverage[top:rows.max() + 1, left:cols.max() + 1],
+                  top - SPRITE_CANVAS[1] // 2, left - SPRITE_CANVAS[0] // 2)
+    _label_sprites[text] = sprite
+    return sprite
+
+def blit_cell_labels(fig, ax, texts, pixels):
+    """Stamp label sprites into the canvas, clipped to the axes
+    
+    Matches drawing the labels as text artists (black at alpha 0.7) to
+    within a pixel of placement, without laying out or rasterizing any
+    glyphs again.
+    """
+    image = np.asarray(fig.canvas.buffer_rgba())
+    height = image.shape[0]
+    x0, y0, x1, y1 = ax.bbox.extents
+    clip_top, clip_bottom = int(round(height - y1)), int(round(height - y0))
+    clip_left, clip_right = int(round(x0)), int(round(x1))
+    
+    for text, (px, py) in zip(texts, pixels):
+        coverage, row_offset, col_offset = label_sprite(text)
+        top = int(round(height - py)) + row_offset
+        left = int(round(px)) + col_offset
+        r0, r1 = max(top, clip_top), min(top + coverage.shape[0], clip_bottom)
+        c0, c1 = max(left, clip_left), min(left + coverage.shape[1], clip_right)
+        if r0 >= r1 or c0 >= c1:
+            continue
+        region = image[r0:r1, c0:c1, :3]
+        region[...] = np.rint(region * (1 - coverage[r0 - top:r1 - top, c0 - left:c1 - left,
+                                                     None]))
+
+# Placement columns, stored as one NumPy array per column (structure of arrays)
+CELL_FIELDS = ('cell_name', 'x', 'y', 'width', 'height', 'fixed')
+
+def read_placement_csv(csv_file):
+    """Read placement CSV into a dict of column arrays (None on read error)"""
     
     try:
         with open(csv_file, 'r') as f:
-            # Skip header line
-            next(f)
-            
-            for line in f:
-                line = line.strip()
-                if not line:
-                    continue
-                    
-                parts = line.split(',')
-                if len(parts) >= 6:
-                    cells.append({
-                        'cell_name': parts[0],
-                        'x': float(parts[1]),
-                        'y': float(parts[2]),
-                        'width': float(parts[3]),
-                        'height': float(parts[4]),
-                        'fixed': parts[5].lower() == 'true'
-                    })
-                
+            # Skip the header and any malformed row with fewer than 6 fields
+            next(f, None)
+            rows = [line for line in f if line.count(',') >= 5]
+        with warnings.catch_warnings():
+            # A header-only CSV is reported below as "no cells", not as a warning
+            warnings.simplefilter('ignore', UserWarning)
+            # No comment character: a '#' is part of a cell name
+            table = np.loadtxt(rows, delimiter=',', dtype=str, usecols=range(6),
+                               ndmin=2, comments=None)
+        return {
+            'cell_name': table[:, 0],
+            'x': table[:, 1].astype(float),
+            'y': table[:, 2].astype(float),
+            'width': table[:, 3].astype(float),
+            'height': table[:, 4].astype(float),
+            'fixed': np.char.lower(table[:, 5]) == 'true'
+        }
     except Exception as e:
         print(f"Error reading CSV file: {e}")
-        return
+        return None
+
+def load_cells(path):
+    """Load placement columns from a CSV or .npz file (None on read error)"""
+    if not path.endswith('.npz'):
+        return read_placement_csv(path)
     
-    # Sort cells: fixed cells first, then by name for consistency
-    cells.sort(key=lambda c: (not c['fixed'], c['cell_name']))
+    try:
+        with np.load(path) as data:
+            return {field: data[field] for field in CELL_FIELDS}
+    except Exception as e:
+        print(f"Error reading NPZ file: {e}")
+        return None
+
+def select_cells(cells, mask):
+    """Return the subset of cells selected by a boolean mask or index array"""
+    return {field: column[mask] for field, column in cells.items()}
+
+def frame_view(cells):
+    """Padded (x_min, y_min, x_max, y_max) view around the cells of a frame"""
     
     # Calculate core area bounds
-    if cells:
-        x_min = min(cell['x'] for cell in cells)
-        y_min = min(cell['y'] for cell in cells)
-        x_max = max(cell['x'] + cell['width'] for cell in cells)
-        y_max = max(cell['y'] + cell['height'] for cell in cells)
-        
-        # Add some padding
-        padding = max((x_max - x_min), (y_max - y_min)) * 0.05
-        x_min -= padding
-        x_max += padding
-        y_min -= padding
-        y_max += padding
+    x_min = cells['x'].min()
+    y_min = cells['y'].min()
+    x_max = (cells['x'] + cells['width']).max()
+    y_max = (cells['y'] + cells['height']).max()
+    
+    # Add some padding
+    padding = max((x_max - x_min), (y_max - y_min)) * 0.05
+    return (x_min - padding, y_min - padding, x_max + padding, y_max + padding)
+
+def visible_cells(cells, view):
+    """Boolean mask of the cells overlapping a (x_min, y_min, x_max, y_max) view"""
+    x_min, y_min, x_max, y_max = view
+    return ((cells['x'] + cells['width'] > x_min) & (cells['x'] < x_max) &
+            (cells['y'] + cells['height'] > y_min) & (cells['y'] < y_max))
+
+# Per-figure frame state: the view, the saved canvas region holding the static
+# chrome for that view, the scale part of its data transform, and persistent
+# cell collections ('cell_colls' keyed by fixed, 'size_colls' by
+# (fixed, width, height))
+_figure_state = weakref.WeakKeyDictionary()
+
+def over_white(color, alpha):
+    """Opaque RGBA of `color` at `alpha` composited over a white background"""
+    from matplotlib.colors import to_rgba
+    r, g, b, _ = to_rgba(color)
+    return (alpha * r + 1 - alpha, alpha * g + 1 - alpha, alpha * b + 1 - alpha, 1.0)
+
+# (facecolor, edgecolor) RGBA of the fixed (True) and movable (False) cells:
+# the 0.6 cell alpha is pre-blended over white so Agg fills without blending
+_cell_colors = None
+
+def cell_colors():
+    """Cell colors keyed by fixed, resolved on first use"""
+    global _cell_colors
+    if _cell_colors is None:
+        _cell_colors = {fixed: (over_white(facecolor, 0.6), over_white(edgecolor, 0.6))
+                        for fixed, facecolor, edgecolor in ((True, 'lightcoral', 'red'),
+                                                            (False, 'lightblue', 'blue'))}
+    return _cell_colors
+
+# Standard cells come in a handful of sizes; beyond this many distinct sizes
+# in a group, per-cell outlines are cheaper than one collection per size
+MAX_SIZE_CLASSES = 64
+
+def axes_box(view):
+    """Figure-fraction (left, bottom, width, height) of the axes for a view
+    
+    The largest box inside MARGINS with equal x and y scale, centered, as
+    set_aspect('equal') would lay it out on every draw.
+    """
+    x_min, y_min, x_max, y_max = view
+    width = MARGINS['right'] - MARGINS['left']
+    height = MARGINS['top'] - MARGINS['bottom']
+    
+    # Data aspect relative to the physical aspect of the margin box
+    ratio = ((y_max - y_min) / (x_max - x_min)) / ((height * FIGSIZE[1]) / (width * FIGSIZE[0]))
+    if ratio > 1:
+        width /= ratio
     else:
-        print("Warning: No cells found in CSV")
-        return
+        height *= ratio
+    return ((MARGINS['left'] + MARGINS['right'] - width) / 2,
+            (MARGINS['bottom'] + MARGINS['top'] - height) / 2, width, height)
+
+def draw_background(fig, ax, view):
+    """Draw the frame-independent chrome for a view and cache its pixels
     
-    # Create figure
-    fig, ax = plt.subplots(1, 1, figsize=(12, 10))
+    Also creates the cell collections that every frame refills in place;
+    they are animated so the background drawn here leaves them out.
+    """
+    import matplotlib
+    import matplotlib.patches as patches
+    from matplotlib.collections import LineCollection, PolyCollection
+    from matplotlib.transforms import AffineDeltaTransform
+    
+    # Start from an empty axes so the figure can be reused across frames
+    ax.clear()
+    x_min, y_min, x_max, y_max = view
     
     # Draw core area boundary
     core_rect = patches.Rectangle((x_min, y_min), x_max - x_min, y_max - y_min,
                                  linewidth=2, edgecolor='black', facecolor='none')
     ax.add_patch(core_rect)
     
-    # Draw cells
-    movable_cells = 0
-    fixed_cells = 0
+    # Fix the view up front so adding cells does not trigger autoscaling
+    ax.set_xlim(x_min, x_max)
+    ax.set_ylim(y_min, y_max)
+    ax.set_autoscale_on(False)
     
-    # Determine whether to show cell labels based on cell count
-    show_labels = len(cells) <= 1000
-    
-    for cell in cells:
-        # Color based on whether cell is fixed
-        if cell['fixed']:
-            facecolor = 'lightcoral'
-            edgecolor = 'red'
-            fixed_cells += 1
-        else:
-            facecolor = 'lightblue'
-            edgecolor = 'blue'
-            movable_cells += 1
-        
-        # Draw cell rectangle
-        cell_rect = patches.Rectangle(
-            (cell['x'], cell['y']),
-            cell['width'], cell['height'],
-            linewidth=1,
-            edgecolor=edgecolor,
-            facecolor=facecolor,
-            alpha=0.6
-        )
-        ax.add_patch(cell_rect)
-        
-        # Add cell name label (only if cell count <= 1000)
-        if show_labels:
-            ax.text(cell['x'] + cell['width']/2,
-                   cell['y'] + cell['height']/2,
-                   cell['cell_name'],
-                   ha='center', va='center',
-                   fontsize=6, alpha=0.7)
+    # Equal scale through the axes box itself; no aspect solve on each draw
+    ax.set_position(axes_box(view))
     
     # Set plot properties
-    ax.set_aspect('equal')
-    ax.set_xlim(x_min, x_max)
-    ax.set_ylim(y_min, y_max)
     ax.set_xlabel('X (micrometers)')
     ax.set_ylabel('Y (micrometers)')
     
-    # Set title
-    if title:
-        ax.set_title(title)
+    # Grid at the major ticks as one LineCollection instead of a Line2D per tick
+    xticks = [x for x in ax.get_xticks() if x_min <= x <= x_max]
+    yticks = [y for y in ax.get_yticks() if y_min <= y <= y_max]
+    grid = LineCollection([[(x, y_min), (x, y_max)] for x in xticks] +
+                          [[(x_min, y), (x_max, y)] for y in yticks],
+                          colors=[over_white(matplotlib.rcParams['grid.color'], 0.3)],
+                          linewidths=matplotlib.rcParams['grid.linewidth'], zorder=0.5)
+    ax.add_collection(grid, autolim=False)
+    
+    cell_colls = {}
+    for fixed, (facecolor, edgecolor) in cell_colors().items():
+        cell_coll = PolyCollection([], facecolors=[facecolor], edgecolors=[edgecolor],
+                                   linewidths=1, rasterized=True, animated=True)
+        cell_colls[fixed] = ax.add_collection(cell_coll, autolim=False)
+    
+    fig.canvas.draw()
+    
+    # transData without its translation; it follows transData, so a vector
+    # savefig at another dpi scales the cell templates with the axes
+    state = {'view': view, 'background': fig.canvas.copy_from_bbox(fig.bbox),
+             'data_scale': AffineDeltaTransform(ax.transData), 'cell_colls': cell_colls,
+             'size_colls': {}}
+    _figure_state[fig] = state
+    return state
+
+def size_class_collection(ax, state, fixed, width, height):
+    """Persistent collection stamping one width x height rectangle per offset"""
+    key = (fixed, width, height)
+    size_coll = state['size_colls'].get(key)
+    if size_coll is None:
+        from matplotlib.collections import PathCollection
+        from matplotlib.path import Path
+        from matplotlib.transforms import Affine2D
+        facecolor, edgecolor = cell_colors()[fixed]
+        template = Path.unit_rectangle().transformed(Affine2D().scale(width, height))
+        size_coll = PathCollection([template], offsets=np.empty((0, 2)),
+                                   offset_transform=ax.transData,
+                                   transform=state['data_scale'],
+                                   facecolors=[facecolor], edgecolors=[edgecolor],
+                                   linewidths=1, rasterized=True, animated=True)
+        state['size_colls'][key] = ax.add_collection(size_coll, autolim=False)
+    return size_coll
+
+def distinct_origins(origins, scale):
+    """Indices of the cell origins that stay distinct on screen
+    
+    Of the origins rounding to the same pixel only the last is kept: it is
+    drawn over the others and hides them but for antialiasing.
+    """
+    pixels = np.round(origins[::-1] * scale)
+    _, last = np.unique(pixels, axis=0, return_index=True)
+    return np.sort(len(origins) - 1 - last)
+
+def draw_cell_group(ax, state, cells, fixed, merge_stacked=True):
+    """Draw the fixed or movable cells of a frame onto the canvas
+    
+    Cells of equal size share one template path drawn at each cell origin,
+    so no per-cell paths are built; size classes are drawn largest first.
+    Groups with many distinct sizes fall back to a PolyCollection of
+    per-cell outlines. Cells stacked on the same pixel as a later cell of
+    their size are drawn once, unless merge_stacked is False (vector
+    frames keep every cell). Returns the collections drawn, in drawing
+    order.
+    """
+    if len(cells['cell_name']) == 0:
+        return []
+    
+    sizes, size_class = np.unique(np.column_stack([cells['width'], cells['height']]),
+                                  axis=0, return_inverse=True)
+    if len(sizes) > MAX_SIZE_CLASSES:
+        cell_coll = state['cell_colls'][fixed]
+        cell_coll.set_verts(cell_verts(cells['x'], cells['y'],
+                                       cells['width'], cells['height']))
+        ax.draw_artist(cell_coll)
+        return [cell_coll]
+    
+    # Largest sizes first, so small cells stay visible on top of big ones
+    size_class = size_class.ravel()
+    pixel_scale = np.diag(state['data_scale'].get_matrix())[:2]
+    drawn = []
+    for i in np.argsort(-sizes[:, 0] * sizes[:, 1], kind='stable'):
+        width, height = sizes[i]
+        members = size_class == i
+        origins = np.column_stack([cells['x'][members], cells['y'][members]])
+        size_coll = size_class_collection(ax, state, fixed, width, height)
+        if merge_stacked:
+            origins = origins[distinct_origins(origins, pixel_scale)]
+        size_coll.set_offsets(origins)
+        ax.draw_artist(size_coll)
+        drawn.append(size_coll)
+    return drawn
+
+# Background PNG writer for in-process rendering (None: write inline)
+_writer = None
+_pending_writes = []
+
+def write_image(output_file, image, frame_key=None):
+    """Write an RGBA frame; PNGs are palette-quantized before encoding"""
+    if not output_file.lower().endswith('.png'):
+        import matplotlib.image as mimage
+        mimage.imsave(output_file, image, dpi=DPI)
+        return
+    pnginfo = PngInfo()
+    if frame_key is not None:
+        pnginfo.add_text(FRAME_KEY_TAG, frame_key)
+    # Frames are opaque: quantizing RGB keeps alpha out of the palette, so
+    # no tRNS chunk is written and no pixel comes out partly transparent
+    frame = Image.fromarray(image[..., :3]).quantize(PALETTE_COLORS,
+                                                     method=Image.Quantize.FASTOCTREE)
+    # The octree rounds its colors down, which turns the white background
+    # into (254, 254, 254); snap near-white entries back to white
+    palette = np.array(frame.getpalette(), dtype=np.uint8).reshape(-1, 3)
+    palette[(palette >= 254).all(axis=1)] = 255
+    frame.putpalette(palette.tobytes())
+    frame.save(output_file, dpi=(DPI, DPI), pnginfo=pnginfo,
+               compress_level=PNG_COMPRESS_LEVEL)
+
+def save_frame(fig, output_file, frame_key=None):
+    """Write the composited canvas as is (savefig would redraw the figure)"""
+    image = np.asarray(fig.canvas.buffer_rgba())
+    if _writer is None:
+        write_image(output_file, image, frame_key)
+    else:
+        # The next frame reuses the canvas, so the writer gets a copy
+        _pending_writes.append((output_file,
+                                _writer.submit(write_image, output_file, image.copy(),
+                                               frame_key)))
+
+def save_vector_frame(fig, cell_artists, output_file):
+    """Save the frame as vector graphics through a full savefig
+    
+    The cell collections are animated (left out of figure draws) and
+    rasterized; both are lifted for this save so only the collections of
+    this frame are written, as plain rectangles.
+    """
+    for artist in cell_artists:
+        artist.set_animated(False)
+        artist.set_rasterized(False)
+    try:
+        fig.savefig(output_file)
+    finally:
+        for artist in cell_artists:
+            artist.set_animated(True)
+            artist.set_rasterized(True)
+
+@contextlib.contextmanager
+def background_writer():
+    """Encode and write frames on a thread while the next frame is drawn
+    
+    Pending writes are finished on exit. A failed write is reported with its
+    file name and added to the yielded list of failed output files; the
+    other frames are still written.
+    """
+    global _writer
+    _writer = ThreadPoolExecutor(max_workers=1)
+    failed = []
+    try:
+        yield failed
+    finally:
+        _writer.shutdown(wait=True)
+        _writer = None
+        writes = _pending_writes[:]
+        _pending_writes.clear()
+        for output_file, write in writes:
+            try:
+                write.result()
+            except Exception as e:
+                print(f"Error: Failed to write '{output_file}': {e}")
+                failed.append(output_file)
+
+def render_placement(fig, ax, cells, output_file, title, view=None, labels=True,
+                     frame_key=None):
+    """Draw one placement frame onto an existing figure and save it
+    
+    Only the per-frame artists (cells, labels, title, legend) are drawn; the
+    static chrome is restored from the cached background when the view is
+    unchanged since the previous frame on this figure.
+    """
+    import matplotlib.patches as patches
+    
+    # Sort cells: fixed cells first, then by name for consistency
+    cells = select_cells(cells, np.lexsort((cells['cell_name'], ~cells['fixed'])))
+    num_cells = len(cells['cell_name'])
+    
+    fixed_cells = int(np.count_nonzero(cells['fixed']))
+    movable_cells = num_cells - fixed_cells
+    
+    if view is None:
+        view = frame_view(cells)
     else:
-        # Extract title from filename
-        base_name = os.path.basename(csv_file).replace('.csv', '')
-        ax.set_title(f'MiniPlacement - {base_name}')
+        # Offscreen cells would only be transformed and clipped away
+        cells = select_cells(cells, visible_cells(cells, view))
+    num_visible = len(cells['cell_name'])
     
-    ax.grid(True, alpha=0.3)
+    state = _figure_state.get(fig)
+    if state is not None and state['view'] == view:
+        fig.canvas.restore_region(state['background'])
+    else:
+        state = draw_background(fig, ax, view)
+    
+    # Per-frame artists, drawn over the background and removed after saving
+    vector = output_file.lower().endswith('.svg')
+    frame_artists = []
+    cell_artists = []
+    
+    spread_x = np.ptp(cells['x'] + cells['width'] / 2) if num_visible else 0.0
+    spread_y = np.ptp(cells['y'] + cells['height'] / 2) if num_visible else 0.0
+    spread = max(spread_x, spread_y)
+    pixel_scale = np.diag(state['data_scale'].get_matrix())[:2]
+    collapsed = (num_visible > 1 and
+                 max(spread_x * pixel_scale[0], spread_y * pixel_scale[1]) < COLLAPSED_SPREAD)
+    
+    if collapsed:
+        # Skip per-cell geometry and labels; summarize the cluster instead
+        x0, y0 = cells['x'].min(), cells['y'].min()
+        x1 = (cells['x'] + cells['width']).max()
+        y1 = (cells['y'] + cells['height']).max()
+        facecolor, edgecolor = cell_colors()[False]
+        frame_artists.append(ax.add_patch(patches.Rectangle(
+            (x0, y0), x1 - x0, y1 - y0,
+            linewidth=1, edgecolor=edgecolor, facecolor=facecolor)))
+        frame_artists.append(ax.text((x0 + x1) / 2, (y0 + y1) / 2,
+                                     f'{num_visible} cells\n(center spread {spread:.3f} um)',
+                                     ha='center', va='center', fontsize=12))
+    else:
+        # Split cells by type; each group refills persistent collections
+        for fixed in (True, False):
+            cell_artists += draw_cell_group(ax, state,
+                                            select_cells(cells, cells['fixed'] == fixed), fixed,
+                                            merge_stacked=not vector)
+    
+    # Determine whether to show cell labels based on cell count
+    show_labels = labels and num_cells <= 1000 and not collapsed
+    
+    # Add cell name labels (only if cell count <= 1000); raster frames stamp
+    # cached label sprites onto the cells already drawn
+    if show_labels:
+        label_texts, label_centers, label_pixels = cell_labels(ax, cells)
+        if vector:
+            frame_artists.extend(draw_cell_labels(ax, label_texts, label_centers))
+        else:
+            blit_cell_labels(fig, ax, label_texts, label_pixels)
     
     # Add legend
+    colors = cell_colors()
     legend_elements = [
-        patches.Rectangle((0, 0), 1, 1, facecolor='lightblue', alpha=0.6,
-                         edgecolor='blue', label=f'Movable Cells ({movable_cells})'),
-        patches.Rectangle((0, 0), 1, 1, facecolor='lightcoral', alpha=0.6,
-                         edgecolor='red', label=f'Fixed Cells ({fixed_cells})')
+        patches.Rectangle((0, 0), 1, 1, facecolor=colors[False][0],
+                         edgecolor=colors[False][1], label=f'Movable Cells ({movable_cells})'),
+        patches.Rectangle((0, 0), 1, 1, facecolor=colors[True][0],
+                         edgecolor=colors[True][1], label=f'Fixed Cells ({fixed_cells})')
     ]
-    ax.legend(handles=legend_elements, loc='upper right')
+    frame_artists.append(ax.legend(handles=legend_elements, loc='upper right'))
     
-    # Determine output file
-    if output_file is None:
-        # Default: replace .csv with .png
-        output_file = csv_file.replace('.csv', '.png')
+    ax.set_title(title)
+    if vector:
+        save_vector_frame(fig, cell_artists, output_file)
+    else:
+        for artist in frame_artists + [ax.title]:
+            ax.draw_artist(artist)
+        save_frame(fig, output_file, frame_key)
     
-    # Save plot
-    plt.savefig(output_file, dpi=150, bbox_inches='tight')
-    plt.close()
+    for artist in frame_artists:
+        artist.remove()
+    ax.set_title('')
     
     print(f"Visualization saved as: {output_file}")
-    print(f"  Total cells: {len(cells)} (movable: {movable_cells}, fixed: {fixed_cells})")
+    print(f"  Total cells: {num_cells} (movable: {movable_cells}, fixed: {fixed_cells})")
+    if num_visible < num_cells:
+        print(f"  Outside the view: {num_cells - num_visible} cells (not drawn)")
+    if collapsed:
+        print(f"  Collapsed frame: cell centers within {spread:.3f} um, drawn as one box")
+    elif show_labels:
+        print(f"  Cell labels: Enabled ({len(label_texts)} drawn, overlapping labels merged)")
+    elif not labels:
+        print(f"  Cell labels: Disabled (--no-labels)")
+    else:
+        print(f"  Cell labels: Disabled (cell count > 1000 to avoid overlap)")
+
+def pixel_frame(view):
+    """Image size and micrometer-to-pixel mapping of the preview engines
+    
+    Returns (width, height, scale, origin_x, origin_y): a point (x, y) lands
+    on pixel (origin_x + scale * x, origin_y - scale * y), with equal aspect
+    and the view centered in the figure margins.
+    """
+    x_min, y_min, x_max, y_max = view
+    width, height = int(FIGSIZE[0] * DPI), int(FIGSIZE[1] * DPI)
+    left, right = MARGINS['left'] * width, MARGINS['right'] * width
+    top, bottom = (1 - MARGINS['top']) * height, (1 - MARGINS['bottom']) * height
+    scale = min((right - left) / (x_max - x_min), (bottom - top) / (y_max - y_min))
+    origin_x = (left + right - scale * (x_max - x_min)) / 2 - scale * x_min
+    origin_y = (top + bottom + scale * (y_max - y_min)) / 2 + scale * y_min
+    return width, height, scale, origin_x, origin_y
+
+def preview_cells(cells, view):
+    """Cells of a preview frame in drawing order, and the frame's view
+    
+    Returns (cells, num_cells, fixed_cells, view); num_cells and
+    fixed_cells count the whole frame, cells only those inside the view.
+    """
+    
+    # Sort cells: fixed cells first, then by name for consistency
+    cells = select_cells(cells, np.lexsort((cells['cell_name'], ~cells['fixed'])))
+    num_cells = len(cells['cell_name'])
+    fixed_cells = int(np.count_nonzero(cells['fixed']))
+    
+    if view is None:
+        view = frame_view(cells)
+    else:
+        cells = select_cells(cells, visible_cells(cells, view))
+    return cells, num_cells, fixed_cells, view
+
+def print_preview_summary(output_file, cells, num_cells, fixed_cells, labels,
+                          show_labels, num_labels):
+    """Report a frame written by one of the preview engines"""
+    num_visible = len(cells['cell_name'])
+    print(f"Visualization saved as: {output_file}")
+    print(f"  Total cells: {num_cells} (movable: {num_cells - fixed_cells}, fixed: {fixed_cells})")
+    if num_visible < num_cells:
+        print(f"  Outside the view: {num_cells - num_visible} cells (not drawn)")
     if show_labels:
-        print(f"  Cell labels: Enabled (cell count <= 1000)")
+        print(f"  Cell labels: Enabled ({num_labels} drawn, overlapping labels merged)")
+    elif not labels:
+        print(f"  Cell labels: Disabled (--no-labels)")
     else:
         print(f"  Cell labels: Disabled (cell count > 1000 to avoid overlap)")
 
+def pillow_color(color):
+    """8-bit RGB of an opaque matplotlib color"""
+    from matplotlib.colors import to_rgba
+    return tuple(int(round(255 * c)) for c in to_rgba(color)[:3])
+
+# Preview fonts for --engine pillow, loaded on first use
+_pillow_fonts = {}
+
+def pillow_font(points):
+    """The matplotlib sans-serif font at a point size, as a Pillow font"""
+    font = _pillow_fonts.get(points)
+    if font is None:
+        from matplotlib.font_manager import findfont
+        font = ImageFont.truetype(findfont(label_font()), points * DPI / 72)
+        _pillow_fonts[points] = font
+    return font
+
+def render_placement_pillow(cells, output_file, title, view=None, labels=True,
+                            frame_key=None):
+    """Draw one placement frame with Pillow's ImageDraw and save it
+    
+    A lightweight preview: core outline, cells, labels and title only (no
+    axes, ticks, grid or legend), at the same image size and view as the
+    matplotlib frames. Drawn without antialiasing; frames are written like
+    matplotlib ones.
+    """
+    
+    cells, num_cells, fixed_cells, view = preview_cells(cells, view)
+    x_min, y_min, x_max, y_max = view
+    width, height, scale, origin_x, origin_y = pixel_frame(view)
+    top = (1 - MARGINS['top']) * height
+    
+    image = Image.new('RGB', (width, height), 'white')
+    draw = ImageDraw.Draw(image, 'RGBA')
+    
+    # Draw core area boundary
+    draw.rectangle((origin_x + scale * x_min, origin_y - scale * y_max,
+                    origin_x + scale * x_max, origin_y - scale * y_min),
+                   outline='black', width=round(2 * DPI / 72))
+    
+    # Cells and labels are drawn over a copy of the chrome and only the view
+    # box is pasted back, clipping them like the axes of a full frame
+    chrome = image.copy()
+    
+    # Cells, one filled and outlined rectangle each, in drawing order
+    px0 = origin_x + scale * cells['x']
+    py0 = origin_y - scale * (cells['y'] + cells['height'])
+    px1 = px0 + scale * cells['width']
+    py1 = py0 + scale * cells['height']
+    for fixed in (True, False):
+        facecolor, edgecolor = map(pillow_color, cell_colors()[fixed])
+        for i in np.flatnonzero(cells['fixed'] == fixed):
+            draw.rectangle((px0[i], py0[i], px1[i], py1[i]), fill=facecolor, outline=edgecolor)
+    
+    show_labels = labels and num_cells <= 1000
+    label_indices = []
+    if show_labels:
+        font = pillow_font(label_font().get_size_in_points())
+        label_indices, label_counts = label_slots((px0 + px1) / 2, (py0 + py1) / 2, px1 - px0)
+        for i, count in zip(label_indices, label_counts):
+            draw.text(((px0[i] + px1[i]) / 2, (py0[i] + py1[i]) / 2),
+                      label_text(cells['cell_name'][i], count),
+                      font=font, fill=(0, 0, 0, 178), anchor='mm')
+    
+    view_box = tuple(round(v) for v in (origin_x + scale * x_min, origin_y - scale * y_max,
+                                        origin_x + scale * x_max, origin_y - scale * y_min))
+    chrome.paste(image.crop(view_box), view_box)
+    image = chrome
+    draw = ImageDraw.Draw(image, 'RGBA')
+    
+    draw.text((width / 2, top / 2), title, font=pillow_font(12), fill='black', anchor='mm')
+    
+    write_image(output_file, np.asarray(image), frame_key)
+    
+    print_preview_summary(output_file, cells, num_cells, fixed_cells, labels,
+                          show_labels, len(label_indices))
+
+def svg_frame_key_line(frame_key):
+    """Comment line holding the frame key, right below the <svg> tag"""
+    return f'<!-- {FRAME_KEY_TAG}={frame_key} -->'
+
+def render_placement_svg(cells, output_file, title, view=None, labels=True,
+                         frame_key=None):
+    """Write one placement frame as an SVG document built from strings
+    
+    The same preview as the pillow engine, as one <rect> per
+    cell and one <text> per label: small, exact at any zoom, and diffable
+    from one iteration to the next.
+    """
+    from matplotlib.colors import to_hex
+    
+    cells, num_cells, fixed_cells, view = preview_cells(cells, view)
+    x_min, y_min, x_max, y_max = view
+    width, height, scale, origin_x, origin_y = pixel_frame(view)
+    top = (1 - MARGINS['top']) * height
+    line_width = DPI / 72
+    
+    parts = [f'<svg xmlns="http://www.w3.org/2000/svg" width="{width}" height="{height}" '
+             f'viewBox="0 0 {width} {height}">',
+             svg_frame_key_line(frame_key),
+             '<rect width="100%" height="100%" fill="white"/>',
+             # Core area boundary
+             f'<rect x="{origin_x + scale * x_min:.2f}" y="{origin_y - scale * y_max:.2f}" '
+             f'width="{scale * (x_max - x_min):.2f}" height="{scale * (y_max - y_min):.2f}" '
+             f'fill="none" stroke="black" stroke-width="{2 * line_width:.2f}"/>',
+             # Cells and labels are clipped to the view, like the axes of a full frame
+             f'<clipPath id="view"><rect x="{origin_x + scale * x_min:.2f}" '
+             f'y="{origin_y - scale * y_max:.2f}" width="{scale * (x_max - x_min):.2f}" '
+             f'height="{scale * (y_max - y_min):.2f}"/></clipPath>',
+             '<g clip-path="url(#view)">']
+    
+    # Cells, one <rect> each in drawing order, grouped by fill and outline
+    px = origin_x + scale * cells['x']
+    py = origin_y - scale * (cells['y'] + cells['height'])
+    pw = scale * cells['width']
+    ph = scale * cells['height']
+    for fixed in (True, False):
+        facecolor, edgecolor = cell_colors()[fixed]
+        members = np.flatnonzero(cells['fixed'] == fixed)
+        if len(members) == 0:
+            continue
+        parts.append(f'<g fill="{to_hex(facecolor)}" stroke="{to_hex(edgecolor)}" '
+                     f'stroke-width="{line_width:.2f}">')
+        parts.extend(f'<rect x="{x:.2f}" y="{y:.2f}" width="{w:.2f}" height="{h:.2f}"/>'
+                     for x, y, w, h in zip(px[members], py[members], pw[members], ph[members]))
+        parts.append('</g>')
+    
+    show_labels = labels and num_cells <= 1000
+    label_indices = []
+    if show_labels:
+        label_indices, label_counts = label_slots(px + pw / 2, py + ph / 2, pw)
+        parts.append(f'<g font-family="{label_font().get_family()[0]}" '
+                     f'font-size="{label_font().get_size_in_points() * DPI / 72:.2f}" '
+                     f'text-anchor="middle" dominant-baseline="central" fill-opacity="0.7">')
+        parts.extend(f'<text x="{px[i] + pw[i] / 2:.2f}" y="{py[i] + ph[i] / 2:.2f}">'
+                     f'{html.escape(label_text(cells["cell_name"][i], count))}</text>'
+                     for i, count in zip(label_indices, label_counts))
+        parts.append('</g>')
+    parts.append('</g>')
+    
+    parts.append(f'<text x="{width / 2:.2f}" y="{top / 2:.2f}" font-family="sans-serif" '
+                 f'font-size="{12 * DPI / 72:.2f}" text-anchor="middle" '
+                 f'dominant-baseline="central">{html.escape(title)}</text>')
+    parts.append('</svg>')
+    
+    with open(output_file, 'w') as f:
+        f.write('\n'.join(parts) + '\n')
+    
+    print_preview_summary(output_file, cells, num_cells, fixed_cells, labels,
+                          show_labels, len(label_indices))
+
+# Rendering options shared by single-file, --batch and --serve runs
+RENDER_DEFAULTS = {'engine': 'matplotlib', 'labels': True, 'force': False, 'view': None}
+
+# PNG text chunk holding the frame key, and a digest of this script so that
+# frames are redrawn whenever the renderer itself changes
+FRAME_KEY_TAG = 'MiniEDA-frame-key'
+with open(__file__, 'rb') as _script:
+    RENDERER_DIGEST = hashlib.blake2b(_script.read(), digest_size=8).hexdigest()
+
+def frame_key(cells, title, view, options):
+    """Hash of everything that determines how a frame is drawn"""
+    digest = hashlib.blake2b(digest_size=8)
+    for field in CELL_FIELDS:
+        digest.update(np.ascontiguousarray(cells[field]).tobytes())
+    digest.update(repr((title, view, options['engine'], options['labels'],
+                        RENDERER_DIGEST)).encode())
+    return digest.hexdigest()
+
+def frame_unchanged(output_file, key):
+    """True if output_file is a frame already drawn from the same inputs"""
+    if output_file.lower().endswith('.svg'):
+        try:
+            with open(output_file, 'r') as f:
+                f.readline()
+                return f.readline().rstrip('\n') == svg_frame_key_line(key)
+        except (OSError, ValueError):
+            return False
+    try:
+        with Image.open(output_file) as image:
+            return image.info.get(FRAME_KEY_TAG) == key
+    except (OSError, ValueError):
+        return False
+
+def reuse_frame(cells, output_file, title, view, options):
+    """Frame key to save with the frame, or None if the existing file is current"""
+    key = frame_key(cells, title, view, options)
+    if not options['force'] and frame_unchanged(output_file, key):
+        print(f"Visualization unchanged: {output_file}")
+        return None
+    return key
+
+def default_title(csv_file):
+    """Extract a plot title from the CSV filename"""
+    base_name = os.path.splitext(os.path.basename(csv_file))[0]
+    return f'MiniPlacement - {base_name}'
+
+def default_output(csv_file):
+    """Default output file: the input path with a .png extension"""
+    return os.path.splitext(csv_file)[0] + '.png'
+
+def engine_output(output_file, options):
+    """Output path for the engine: --engine svg always writes .svg files"""
+    if options['engine'] != 'svg':
+        return output_file
+    return os.path.splitext(output_file)[0] + '.svg'
+
+def plot_placement(csv_file, output_file=None, title=None, options=RENDER_DEFAULTS):
+    """Read placement data from CSV and create visualization"""
+    
+    cells = load_cells(csv_file)
+    if cells is None:
+        return
+    if len(cells['cell_name']) == 0:
+        print("Warning: No cells found in CSV")
+        return
+    
+    # Determine output file
+    if output_file is None:
+        output_file = default_output(csv_file)
+    output_file = engine_output(output_file, options)
+    
+    title = title or default_title(csv_file)
+    key = reuse_frame(cells, output_file, title, options['view'], options)
+    if key is None:
+        return
+    if options['engine'] == 'pillow':
+        render_placement_pillow(cells, output_file, title, options['view'],
+                                options['labels'], key)
+        return
+    if options['engine'] == 'svg':
+        render_placement_svg(cells, output_file, title, options['view'],
+                             options['labels'], key)
+        return
+    
+    fig, ax = new_figure()
+    render_placement(fig, ax, cells, output_file, title, options['view'],
+                     options['labels'], key)
+
+# Per-process figure reused by every frame a batch worker renders
+_worker_figure = None
+
+def _load_job_cells(csv_file):
+    """Load the cells of a batch job (None if missing or empty)"""
+    if not os.path.exists(csv_file):
+        print(f"Error: Input file '{csv_file}' not found")
+        return None
+    
+    cells = load_cells(csv_file)
+    if cells is None or len(cells['cell_name']) == 0:
+        print(f"Warning: No cells found in {csv_file}")
+        return None
+    return cells
+
+def _job_view(job):
+    """View of one batch job's cells (None if the frame cannot be read)
+    
+    Like _render_job, a failing frame is reported and skipped, so it cannot
+    abort the shared-view pass of the whole batch.
+    """
+    if not os.path.exists(job[0]):
+        return None  # Reported when the job itself is rendered
+    try:
+        cells = load_cells(job[0])
+        if cells is None or len(cells['cell_name']) == 0:
+            return None
+        return frame_view(cells)
+    except Exception as e:
+        print(f"Error: Failed to read '{job[0]}': {e}")
+        sys.stdout.flush()
+        return None
+
+def _render_job(job):
+    """Render one (csv_file, output_file, title, view, options) batch job
+    
+    Returns False if the frame could not be rendered. A failing frame is
+    reported and skipped, so the rest of the batch (and of a --serve run)
+    still renders.
+    """
+    global _worker_figure
+    
+    try:
+        return _render_job_frame(job)
+    except Exception as e:
+        print(f"Error: Failed to render '{job[0]}' to '{job[1]}': {e}")
+        sys.stdout.flush()
+        # The figure may still hold artists of the half-drawn frame
+        _worker_figure = None
+        return False
+
+def _render_job_frame(job):
+    """Render one batch job's frame (False if its input cannot be read)"""
+    global _worker_figure
+    
+    csv_file, output_file, title, view, options = job
+    output_file = engine_output(output_file, options)
+    cells = _load_job_cells(csv_file)
+    if cells is None:
+        return False
+    
+    key = reuse_frame(cells, output_file, title, view, options)
+    if key is None:
+        return True
+    if options['engine'] == 'pillow':
+        render_placement_pillow(cells, output_file, title, view, options['labels'], key)
+        sys.stdout.flush()
+        return True
+    if options['engine'] == 'svg':
+        render_placement_svg(cells, output_file, title, view, options['labels'], key)
+        sys.stdout.flush()
+        return True
+    
+    if _worker_figure is None:
+        _worker_figure = new_figure()
+    fig, ax = _worker_figure
+    render_placement(fig, ax, cells, output_file, title, view, options['labels'], key)
+    sys.stdout.flush()
+    return True
+
+def shared_view(views):
+    """Smallest view containing every frame view (None if there are none)"""
+    views = np.array([view for view in views if view is not None])
+    if len(views) == 0:
+        return None
+    return (views[:, 0].min(), views[:, 1].min(), views[:, 2].max(), views[:, 3].max())
+
+def parse_job(line):
+    """Parse one tab-separated job line (None for a blank line)"""
+    parts = line.rstrip('\n').split('\t')
+    if not parts[0]:
+        return None
+    csv_file = parts[0]
+    output_file = parts[1] if len(parts) > 1 and parts[1] else default_output(csv_file)
+    title = parts[2] if len(parts) > 2 and parts[2] else default_title(csv_file)
+    return (csv_file, output_file, title)
+
+def read_jobs(jobs_file):
+    """Parse a tab-separated jobs file into (csv_file, output_file, title) tuples"""
+    with open(jobs_file, 'r') as f:
+        return [job for job in map(parse_job, f) if job is not None]
+
+def _render_jobs(jobs, map_fn, options):
+    """Render jobs in their shared view using a map()-like function"""
+    view = options['view'] or shared_view(map_fn(_job_view, jobs))
+    return list(map_fn(_render_job, [job + (view, options) for job in jobs]))
+
+def render_batch(jobs, workers=None, pool=None, options=RENDER_DEFAULTS):
+    """Render many frames, fanning out across a process pool
+    
+    Every frame is drawn in the union of the frame views (or in the fixed
+    view from the options), so the animation does not rescale between frames
+    and the background is drawn only once.
+    An existing pool of `workers` processes is reused when given.
+    """
+    if not jobs:
+        return True
+    
+    workers = workers or os.cpu_count() or 1
+    failed_writes = []
+    if pool is not None:
+        results = _render_jobs(jobs, pool.map, options)
+    else:
+        workers = min(len(jobs), workers)
+        if workers <= 1:
+            with background_writer() as failed_writes:
+                results = _render_jobs(jobs, map, options)
+        else:
+            with multiprocessing.Pool(workers) as pool:
+                results = _render_jobs(jobs, pool.map, options)
+    
+    rendered = sum(results) - len(failed_writes)
+    print(f"Batch rendered {rendered}/{len(jobs)} frames with {workers} worker(s)")
+    sys.stdout.flush()
+    return rendered == len(jobs)
+
+def serve(workers=None, options=RENDER_DEFAULTS):
+    """Render job batches read from stdin until end of input"""
+    workers = workers or os.cpu_count() or 1
+    pool = multiprocessing.Pool(workers) if workers > 1 else None
+    
+    ok = True
+    batch = []
+    try:
+        for line in sys.stdin:
+            job = parse_job(line)
+            if job is not None:
+                batch.append(job)
+                continue
+            ok = render_batch(batch, workers, pool, options) and ok
+            batch = []
+        ok = render_batch(batch, workers, pool, options) and ok
+    finally:
+        if pool is not None:
+            pool.close()
+            pool.join()
+    return ok
+
 def main():
     parser = argparse.ArgumentParser(description='Plot placement visualization from CSV')
-    parser.add_argument('csv_file', help='Input CSV file with placement data')
+    parser.add_argument('csv_file', nargs='?', help='Input CSV file with placement data')
     parser.add_argument('output_file', nargs='?', help='Output PNG file (optional)')
     parser.add_argument('--title', help='Plot title (optional)')
+    parser.add_argument('--batch', metavar='JOBS_FILE',
+                        help='Render every frame listed in a tab-separated jobs file')
+    parser.add_argument('--serve', action='store_true',
+                        help='Render job batches read from stdin (blank line ends a batch)')
+    parser.add_argument('--workers', type=int,
+                        help='Worker processes for --batch/--serve (default: CPU count)')
+    parser.add_argument('--engine', choices=('matplotlib', 'pillow', 'svg'),
+                        default='matplotlib',
+                        help='pillow and svg draw quick previews without axes '
+                             '(svg writes .svg files)')
+    parser.add_argument('--no-labels', action='store_true',
+                        help='Do not draw cell name labels')
+    parser.add_argument('--force', action='store_true',
+                        help='Redraw frames even if their PNG is up to date')
+    parser.add_argument('--view', type=float, nargs=4,
+                        metavar=('X_MIN', 'Y_MIN', 'X_MAX', 'Y_MAX'),
+                        help='Plot only this region (micrometers); outside cells are skipped')
     
     args = parser.parse_args()
     
+    if args.view is not None and (args.view[0] >= args.view[2] or args.view[1] >= args.view[3]):
+        parser.error('--view needs X_MIN < X_MAX and Y_MIN < Y_MAX')
+    options = dict(RENDER_DEFAULTS, engine=args.engine, labels=not args.no_labels,
+                   force=args.force, view=tuple(args.view) if args.view else None)
+    
+    if args.serve:
+        if not serve(args.workers, options):
+            sys.exit(1)
+        return
+    
+    if args.batch:
+        if not os.path.exists(args.batch):
+            print(f"Error: Jobs file '{args.batch}' not found")
+            sys.exit(1)
+        if not render_batch(read_jobs(args.batch), args.workers, options=options):
+            sys.exit(1)
+        return
+    
+    if args.csv_file is None:
+        parser.error('csv_file is required unless --batch or --serve is given')
+    
     # Check if input file exists
     if not os.path.exists(args.csv_file):
         print(f"Error: Input file '{args.csv_file}' not found")
         sys.exit(1)
     
-    plot_placement(args.csv_file, args.output_file, args.title)
+    plot_placement(args.csv_file, args.output_file, args.title, options)
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    main()
+    # Output is complete: skip interpreter teardown (module cleanup and final
+    # garbage collection of the matplotlib state), which costs ~150 ms
+    sys.stdout.flush()
+    sys.stderr.flush()
+    os._exit(0)
@@ -4,11 +4,16 @@ Density Map Visualization Script
 Usage: python visualize_density.py <density_csv_file> [output_image]
 """
 
-import matplotlib.pyplot as plt
+from matplotlib.figure import Figure
+from matplotlib.backends.backend_agg import FigureCanvasAgg
 import numpy as np
 import sys
 import os
 
+# zlib level for the heatmap PNG: level 3 deflates much faster than the
+# default 6 at the cost of a larger (still ~100 KB) file
+PNG_COMPRESS_LEVEL = 3
+
 def create_heatmap(csv_file, output_image=None):
     """
     Create a heatmap from density CSV data
@@ -56,11 +61,20 @@ def create_heatmap(csv_file, output_image=None):
         y_idx = y_coords.index(y)
         density_matrix[y_idx, x_idx] = density
     
-    # Create the plot
-    plt.figure(figsize=(12, 8))
+    # Create the plot: rendering straight to a file needs neither pyplot nor
+    # a GUI backend, only an Agg canvas
+    if output_image:
+        fig = Figure(figsize=(12, 8), dpi=150)
+        FigureCanvasAgg(fig)
+    else:
+        import matplotlib.pyplot as plt
+        fig = plt.figure(figsize=(12, 8), dpi=150)
+    ax = fig.add_subplot()
+    # Fixed margins (room for the colorbar label) instead of a tight bbox
+    fig.subplots_adjust(left=0.07, right=0.98, bottom=0.08, top=0.94)
     
     # Create heatmap
-    im = plt.imshow(density_matrix, 
+    im = ax.imshow(density_matrix, 
                    extent=[x_coords[0], x_coords[-1], y_coords[0], y_coords[-1]],
                    origin='lower', 
                    cmap='hot', 
@@ -68,16 +82,16 @@ def create_heatmap(csv_file, output_image=None):
                    aspect='auto')
     
     # Add colorbar
-    cbar = plt.colorbar(im)
+    cbar = fig.colorbar(im, ax=ax)
     cbar.set_label('Cell Density', rotation=270, labelpad=20)
     
     # Labels and title
-    plt.xlabel('X Coordinate (μm)')
-    plt.ylabel('Y Coordinate (μm)')
-    plt.title('Placement Density Map')
+    ax.set_xlabel('X Coordinate (μm)')
+    ax.set_ylabel('Y Coordinate (μm)')
+    ax.set_title('Placement Density Map')
     
     # Add grid
-    plt.grid(True, alpha=0.3)
+    ax.grid(True, alpha=0.3)
     
     # Add density statistics as text
     densities = [d[2] for d in data]
@@ -87,12 +101,14 @@ def create_heatmap(csv_file, output_image=None):
     total_bins = len(densities)
     
     stats_text = f'Max Density: {max_density:.3f}\nAvg Density: {avg_density:.3f}\nOvercrowded Bins: {overcrowded}/{total_bins} ({100*overcrowded/total_bins:.1f}%)'
-    plt.text(0.02, 0.98, stats_text, transform=plt.gca().transAxes, 
-             verticalalignment='top', bbox=dict(boxstyle='round', facecolor='white', alpha=0.8))
+    ax.text(0.02, 0.98, stats_text, transform=ax.transAxes, 
+            verticalalignment='top', bbox=dict(boxstyle='round', facecolor='white', alpha=0.8))
     
     # Save or show
     if output_image:
-        plt.savefig(output_image, dpi=150, bbox_inches='tight')
+        # Write the Agg canvas directly; savefig would re-measure the layout
+        with open(output_image, 'wb') as f:
+            fig.canvas.print_png(f, pil_kwargs={'compress_level': PNG_COMPRESS_LEVEL})
         print(f"Density heatmap saved to {output_image}")
     else:
         plt.show()
@@ -120,4 +136,8 @@ def main():
         sys.exit(1)
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    main()
+    # Heatmap is written; exit without the slow interpreter teardown
+    sys.stdout.flush()
+    sys.stderr.flush()
+    os._exit(0)